@@ -1,9 +1,12 @@
 # frontend/app.py
+import asyncio
 import os
+import sqlite3
 import streamlit as st
-import requests
+import httpx
+from diskcache import Cache
+import orjson
 import pandas as pd
-import plotly.express as px
 from streamlit_option_menu import option_menu
 
 # Set page config FIRST
@@ -11,18 +14,156 @@ st.set_page_config(page_title="Islamic Digital Economy Dashboard", layout="wide"
 
 # Backend configuration
 BACKEND_URL = os.getenv("BACKEND_API_URL", "http://backend:8000")
+CACHE_DIR = os.getenv("CACHE_DIR", "/tmp/econ-dash-cache")
+DISK_CACHE_EXPIRE = 600
 
-def check_backend():
+# One timeout/pool/retry policy for both the sync client and async batches
+HTTP_TIMEOUT = httpx.Timeout(10, connect=3)
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+HTTP_RETRIES = 2
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """Shared keep-alive HTTP client so backend calls reuse pooled connections."""
+    return httpx.Client(
+        timeout=HTTP_TIMEOUT,
+        transport=httpx.HTTPTransport(limits=HTTP_LIMITS, retries=HTTP_RETRIES)
+    )
+
+def decode_json(response: httpx.Response):
+    """Raise for error statuses and decode the response body with orjson."""
+    response.raise_for_status()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise httpx.DecodingError(str(e), request=response.request) from e
+
+@st.cache_resource
+def get_disk_cache():
+    """On-disk response cache shared by all sessions and workers on this host.
+
+    Returns None when ``CACHE_DIR`` can't be used (e.g. a read-only filesystem),
+    in which case responses are only cached in memory.
+    """
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=10)
+        return Cache(CACHE_DIR, size_limit=500 * 2**20)
+    except (OSError, sqlite3.Error):
+        return None
+
+def disk_cache_get(key):
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return None
+    try:
+        return disk_cache.get(key)
+    except (OSError, sqlite3.Error):
+        return None
+
+def disk_cache_set(key, body: bytes):
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return
+    try:
+        disk_cache.set(key, body, expire=DISK_CACHE_EXPIRE)
+    except (OSError, sqlite3.Error):
+        pass
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_json(path: str, params: tuple = ()):
+    """GET a backend endpoint and return its decoded JSON, memoized across reruns.
+
+    ``params`` is a tuple of ``(key, value)`` pairs so it can be hashed into the
+    cache key; list-valued params must be passed as tuples. Raw response bodies
+    are also kept on disk for 10 minutes so restarts and sibling workers start warm.
+    """
+    key = (BACKEND_URL, path, params)
+    body = disk_cache_get(key)
+    if body is not None:
+        return orjson.loads(body)
+
+    response = get_client().get(f"{BACKEND_URL}/{path}", params=dict(params))
+    payload = decode_json(response)
+    disk_cache_set(key, response.content)
+    return payload
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns and dictionary-encode ``country`` to shrink Arrow payloads."""
+    for column in df.select_dtypes("float").columns:
+        df[column] = pd.to_numeric(df[column], downcast="float")
+    for column in df.select_dtypes("integer").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    if "country" in df:
+        df["country"] = df["country"].astype("category")
+    return df
+
+def to_df(payload) -> pd.DataFrame:
+    """Build a DataFrame from a list of records, wrapping a single record only when needed."""
+    df = pd.DataFrame(payload) if isinstance(payload, list) else pd.DataFrame([payload])
+    return compact_dtypes(df)
+
+async def _gather_json(calls, defaults):
+    keys = [(BACKEND_URL, path, params) for path, params in calls]
+    results = list(defaults)
+    misses = []
+    for i, key in enumerate(keys):
+        body = disk_cache_get(key)
+        if body is None:
+            misses.append(i)
+        else:
+            results[i] = orjson.loads(body)
+    if not misses:
+        return results
+
+    transport = httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, retries=HTTP_RETRIES)
+    async with httpx.AsyncClient(base_url=BACKEND_URL, timeout=HTTP_TIMEOUT, transport=transport) as client:
+        responses = await asyncio.gather(
+            *(client.get(calls[i][0], params=dict(calls[i][1])) for i in misses),
+            return_exceptions=True
+        )
+    for i, response in zip(misses, responses):
+        if isinstance(response, BaseException):
+            raise response
+        try:
+            results[i] = decode_json(response)
+        except (httpx.HTTPStatusError, httpx.DecodingError):
+            continue
+        disk_cache_set(keys[i], response.content)
+    return results
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_json_many(calls: tuple, defaults: tuple) -> list:
+    """Fetch several ``(path, params)`` endpoints concurrently on one event loop.
+
+    Calls already in the disk cache are served from it and only the rest go
+    over the network. A call the backend answers with an error status or an
+    undecodable body is replaced by its entry in ``defaults``, so the batch is
+    still cached. Connection failures raise instead, so transient outages are
+    never cached.
+    """
+    return asyncio.run(_gather_json(calls, defaults))
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_download(report: str) -> bytes:
+    response = get_client().get(f"{BACKEND_URL}/download/{report}")
+    response.raise_for_status()
+    return response.content
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def list_countries() -> list:
+    return sorted({row["country"] for row in fetch_json("query/halal_ecommerce")})
+
+@st.cache_data(ttl=5, show_spinner=False)
+def backend_up():
+    try:
+        response = get_client().get(f"{BACKEND_URL}/health", timeout=1)
         return response.status_code == 200
-    except:
+    except httpx.HTTPError:
         return False
 
-# Skip backend check for testing
-# if not check_backend():
-#     st.error("⚠️ Backend service not available. Please check if the backend container is running.")
-#     st.stop()
+# Bail out early instead of letting every section wait on its own timeout
+if not backend_up():
+    st.info("⚠️ Backend service not available. Please check if the backend container is running.")
+    st.stop()
 
 # Sidebar filters
 st.sidebar.image("https://via.placeholder.com/200x100?text=Islamic+Economy+Dashboard ")
@@ -30,13 +171,15 @@ st.sidebar.markdown("## 🌍 Filters")
 
 # Country selector
 try:
-    response = requests.get(f"{BACKEND_URL}/query/halal_ecommerce")
-    countries = list(set(row["country"] for row in response.json())) if response.status_code == 200 else ["Malaysia", "Indonesia", "Saudi Arabia"]
-except:
+    countries = list_countries()
+except (httpx.HTTPError, KeyError, TypeError):
     countries = ["Malaysia", "Indonesia", "Saudi Arabia"]
 
-selected_countries = st.sidebar.multiselect("Select Countries", options=countries, default=countries)
-selected_year = st.sidebar.slider("Select Year", min_value=2015, max_value=2025, value=2020)
+# Filters only apply on submit, so dragging the slider doesn't trigger a rerun per step
+with st.sidebar.form("filters"):
+    selected_countries = st.multiselect("Select Countries", options=countries, default=countries)
+    selected_year = st.slider("Select Year", min_value=2015, max_value=2025, value=2020)
+    st.form_submit_button("Apply filters")
 
 # ✅ MAIN TITLE (Now using Streamlit defaults)
 st.title("📊 Islamic Digital Economy Dashboard")
@@ -52,176 +195,277 @@ selected = option_menu(
     orientation="horizontal"
 )
 
-# Tab: Halal E-commerce
-if selected == "Halal E-commerce":
+@st.cache_data(ttl=300, show_spinner=False)
+def make_figure(kind: str, df: pd.DataFrame, palette: str = None, **kwargs):
+    """Build a Plotly Express figure, memoized on chart type, data and options.
+
+    ``palette`` names a ``px.colors.qualitative`` sequence. Plotly is imported
+    here so it only loads once a chart is actually drawn.
+    """
+    import plotly.express as px
+
+    if palette:
+        kwargs["color_discrete_sequence"] = getattr(px.colors.qualitative, palette)
+    return getattr(px, kind)(df, **kwargs)
+
+PAGE_SIZE = 100
+
+def show_paginated(df, key):
+    """Render one page of ``df`` so only the visible rows are serialized to the browser."""
+    pages = max(1, -(-len(df) // PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=key)
+    start = (page - 1) * PAGE_SIZE
+    st.dataframe(df.iloc[start:start + PAGE_SIZE], use_container_width=True)
+    st.caption(f"Page {page} of {pages} · {len(df)} rows")
+
+# Each section is a fragment so widgets inside it only rerun that section
+@st.fragment
+def halal_ecommerce_tab():
     st.header("🛒 Halal E-commerce Growth")
-    rev_response = requests.get(
-        f"{BACKEND_URL}/aggregation/halal_ecommerce",
-        params={"metric": "revenue_usd", "group_by": "country"}
-    )
-    if rev_response.status_code == 200:
-        rev_data = rev_response.json()
-        rev_df = pd.DataFrame(rev_data if isinstance(rev_data, list) else [rev_data])
+    try:
+        rev_data = fetch_json("aggregation/halal_ecommerce", (("group_by", "country"), ("metric", "revenue_usd")))
+    except httpx.HTTPError:
+        rev_data = None
+    if rev_data is not None:
+        rev_df = to_df(rev_data)
         if not rev_df.empty:
-            fig = px.bar(
+            fig = make_figure(
+                "bar",
                 rev_df,
                 x="country",
                 y="total",
                 title="Total Revenue by Country",
                 color="country",
-                color_discrete_sequence=px.colors.qualitative.Prism
+                palette="Prism"
             )
             st.plotly_chart(fig, use_container_width=True)
 
-# Tab: ICT & Fintech
-elif selected == "ICT & Fintech":
+@st.fragment
+def ict_fintech_tab():
+    calls = (
+        ("aggregation/ict_services", (("group_by", "country"), ("metric", "gross_output"))),
+        ("query/internet_penetration", ()),
+    )
+    try:
+        ict_data, penetration_data = fetch_json_many(calls, (None, None))
+    except httpx.HTTPError:
+        ict_data = penetration_data = None
+
     col1, col2 = st.columns(2)
     with col1:
-        ict_response = requests.get(
-            f"{BACKEND_URL}/aggregation/ict_services",
-            params={"metric": "gross_output", "group_by": "country"}
-        )
-        if ict_response.status_code == 200:
-            ict_data = ict_response.json()
-            ict_df = pd.DataFrame(ict_data if isinstance(ict_data, list) else [ict_data])
+        if ict_data is not None:
+            ict_df = to_df(ict_data)
             if not ict_df.empty:
                 st.markdown("## 📶 ICT Services Output")
-                ict_fig = px.area(
+                ict_fig = make_figure(
+                    "area",
                     ict_df,
                     x="country",
                     y="total",
                     title="Gross Output by Country",
                     color="country",
-                    color_discrete_sequence=px.colors.qualitative.Bold
+                    palette="Bold"
                 )
                 st.plotly_chart(ict_fig, use_container_width=True)
     with col2:
-        penetration_response = requests.get(f"{BACKEND_URL}/query/internet_penetration")
-        if penetration_response.status_code == 200:
-            penetration_data = penetration_response.json()
-            penetration_df = pd.DataFrame(penetration_data if isinstance(penetration_data, list) else [penetration_data])
+        if penetration_data is not None:
+            penetration_df = to_df(penetration_data)
             if not penetration_df.empty:
-                penetration_df["internet_penetration"] = penetration_df["internet_penetration"].str.replace("%", "").astype(float)
-                penetration_fig = px.bar(
+                penetration_df["internet_penetration"] = pd.to_numeric(
+                    penetration_df["internet_penetration"].str.rstrip("%"),
+                    errors="coerce",
+                    downcast="float"
+                )
+                penetration_fig = make_figure(
+                    "bar",
                     penetration_df,
                     x="country",
                     y="internet_penetration",
                     title="Internet Penetration Rate",
                     color="country",
                     range_y=[0, 100],
-                    color_discrete_sequence=px.colors.qualitative.Set1
+                    palette="Set1"
                 )
                 st.plotly_chart(penetration_fig, use_container_width=True)
 
-# Tab: AI Insights
-elif selected == "AI Insights":
+@st.fragment
+def ai_insights_tab():
     st.header("🤖 AI-Powered Analysis")
     user_query = st.text_input("Ask a question about the data")
     if st.button("Get AI Analysis") and user_query.strip():
-        ai_response = requests.post(f"{BACKEND_URL}/ai_query", json={"question": user_query})
-        if ai_response.status_code == 200:
-            ai_data = ai_response.json()
+        try:
+            # No read timeout for slow AI answers, but still fail fast on connect
+            ai_response = get_client().post(
+                f"{BACKEND_URL}/ai_query",
+                json={"question": user_query},
+                timeout=httpx.Timeout(None, connect=3)
+            )
+            ai_data = decode_json(ai_response)
+        except httpx.HTTPStatusError as e:
+            st.error(f"AI Query Failed: {e.response.text}")
+        except httpx.HTTPError as e:
+            st.error(f"AI Query Failed: {e}")
+        else:
             st.markdown("### 🤖 AI Analysis")
             st.markdown(ai_data.get("answer", "No answer returned."))
             if "result" in ai_data:
                 ai_df = pd.DataFrame(ai_data["result"])
                 st.markdown("### 📊 Query Results")
                 st.dataframe(ai_df)
-        else:
-            st.error(f"AI Query Failed: {ai_response.text}")
 
-# Tab: Data Explorer
-elif selected == "Data Explorer":
+@st.fragment
+def data_explorer_tab(countries):
     st.header("🔍 Explore Raw Data")
     data_type = st.selectbox("Select Dataset", ["halal_ecommerce", "ict_services", "internet_penetration", "islamic_fintech"])
     filter_country = st.multiselect("Filter by Country", options=countries, default=countries)
-    data_response = requests.get(f"{BACKEND_URL}/query/{data_type}", params={"countries": filter_country})
-    if data_response.status_code == 200:
-        raw_data = data_response.json()
-        df = pd.DataFrame(raw_data if isinstance(raw_data, list) else [raw_data])
-        st.dataframe(df)
+    try:
+        raw_data = fetch_json(f"query/{data_type}", (("countries", tuple(filter_country)),))
+    except httpx.HTTPError:
+        raw_data = None
+    if raw_data is not None:
+        df = to_df(raw_data)
+        show_paginated(df, key=f"explorer_page_{data_type}")
     else:
         st.warning("No data available for this selection.")
 
-# Summary metrics
-st.markdown("## 📈 Key Metrics")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    response = requests.get(f"{BACKEND_URL}/summary/halal_ecommerce")
-    data = response.json() if response.status_code == 200 else {"count": 0, "avg_growth_rate": 0}
-    st.metric("Total Halal Revenue", f"${data.get('count', 0) * 1_000_000:,.0f} USD")
+summary_defaults = {
+    "halal_ecommerce": {"count": 0, "avg_growth_rate": 0},
+    "islamic_fintech": {"count": 0},
+    "ict_services": {"count": 0},
+    "household_ict": {"avg_growth_rate": 75.4},
+}
 
-with col2:
-    response = requests.get(f"{BACKEND_URL}/summary/islamic_fintech")
-    data = response.json() if response.status_code == 200 else {"count": 0}
-    st.metric("Total Fintech Transactions", f"${data.get('count', 0) * 1_000_000:,.0f} USD")
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_summaries() -> dict:
+    """Summaries for every dataset, keyed by dataset name.
 
-with col3:
-    response = requests.get(f"{BACKEND_URL}/summary/ict_services")
-    data = response.json() if response.status_code == 200 else {"count": 0}
-    st.metric("Total ICT Output", f"${data.get('count', 0) * 1_000_000:,.0f} USD")
+    Uses the combined ``/summary/all`` endpoint when it answers with a summary
+    for every dataset, and otherwise batches the per-dataset endpoints, using
+    ``summary_defaults`` for any that fail.
+    """
+    try:
+        summaries = fetch_json("summary/all")
+    except (httpx.HTTPStatusError, httpx.DecodingError):
+        summaries = None
+    if isinstance(summaries, dict) and all(isinstance(summaries.get(endpoint), dict) for endpoint in summary_defaults):
+        return summaries
+    calls = tuple((f"summary/{endpoint}", ()) for endpoint in summary_defaults)
+    return dict(zip(summary_defaults, fetch_json_many(calls, tuple(summary_defaults.values()))))
 
-with col4:
-    response = requests.get(f"{BACKEND_URL}/summary/household_ict")
-    data = response.json() if response.status_code == 200 else {"avg_growth_rate": 75.4}
-    st.metric("Average Internet Usage", f"{data.get('avg_growth_rate', 75.4):.1f}%")
+@st.fragment
+def key_metrics():
+    st.markdown("## 📈 Key Metrics")
+    col1, col2, col3, col4 = st.columns(4)
 
-# Country profile tool
-st.markdown("## 🌏 Country Profile Tool")
-country_profile = st.selectbox("Select Country for Detailed Analysis", countries)
+    try:
+        summaries = fetch_summaries()
+    except httpx.HTTPError:
+        summaries = summary_defaults
 
-if country_profile:
-    col1, col2 = st.columns(2)
     with col1:
-        st.markdown(f"### {country_profile} - Halal E-commerce")
-        response = requests.get(f"{BACKEND_URL}/query/halal_ecommerce", params={"countries": [country_profile]})
-        df = pd.DataFrame(response.json() if response.status_code == 200 else [])
-        st.dataframe(df)
+        data = summaries["halal_ecommerce"]
+        st.metric("Total Halal Revenue", f"${data.get('count', 0) * 1_000_000:,.0f} USD")
+
     with col2:
-        st.markdown(f"### {country_profile} - Fintech")
-        fintech_response = requests.get(f"{BACKEND_URL}/query/islamic_fintech", params={"countries": [country_profile]})
-        fintech_df = pd.DataFrame(fintech_response.json() if fintech_response.status_code == 200 else [])
-        st.dataframe(fintech_df)
+        data = summaries["islamic_fintech"]
+        st.metric("Total Fintech Transactions", f"${data.get('count', 0) * 1_000_000:,.0f} USD")
+
+    with col3:
+        data = summaries["ict_services"]
+        st.metric("Total ICT Output", f"${data.get('count', 0) * 1_000_000:,.0f} USD")
+
+    with col4:
+        data = summaries["household_ict"]
+        st.metric("Average Internet Usage", f"{data.get('avg_growth_rate', 75.4):.1f}%")
+
+def country_rows(dataset, country):
+    # Filter the cached full table locally instead of querying the backend per country
+    try:
+        df = to_df(fetch_json(f"query/{dataset}"))
+    except httpx.HTTPError:
+        return pd.DataFrame([])
+    return df[df["country"] == country] if "country" in df else df
+
+@st.fragment
+def country_profile_tool(countries):
+    st.markdown("## 🌏 Country Profile Tool")
+    country_profile = st.selectbox("Select Country for Detailed Analysis", countries)
+
+    if country_profile:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f"### {country_profile} - Halal E-commerce")
+            df = country_rows("halal_ecommerce", country_profile)
+            show_paginated(df, key="profile_halal_page")
+        with col2:
+            st.markdown(f"### {country_profile} - Fintech")
+            fintech_df = country_rows("islamic_fintech", country_profile)
+            show_paginated(fintech_df, key="profile_fintech_page")
 
-# Country comparison
-st.markdown("## 🌐 Country-wise Total Comparison Across Sectors")
 metrics = {
     "Halal E-commerce": "halal_ecommerce",
     "Islamic Fintech": "islamic_fintech",
     "ICT Services": "ict_services"
 }
-country_totals = {}
 
-for label, endpoint in metrics.items():
+@st.fragment
+def country_comparison():
+    st.markdown("## 🌐 Country-wise Total Comparison Across Sectors")
     try:
-        response = requests.get(f"{BACKEND_URL}/aggregation/{endpoint}", params={"metric": "count", "group_by": "country"})
-        if response.status_code == 200:
-            data = response.json()
-            df = pd.DataFrame(data if isinstance(data, list) else [data])
-            for _, row in df.iterrows():
-                country = row["country"]
-                total = row["total"] * 1_000_000
-                if country not in country_totals:
-                    country_totals[country] = {}
-                country_totals[country][label] = total
-    except Exception as e:
-        continue
-
-if country_totals:
-    comparison_df = pd.DataFrame.from_dict(country_totals, orient="index").fillna(0).reset_index().rename(columns={"index": "Country"})
-    melted_df = comparison_df.melt(id_vars="Country", var_name="Sector", value_name="Total (USD)")
-    compare_fig = px.bar(
-        melted_df,
-        x="Country",
-        y="Total (USD)",
-        color="Sector",
-        title="Total Digital Economy Metrics by Country and Sector",
-        barmode="group",
-        text_auto='.2s',
-        color_discrete_sequence=px.colors.qualitative.Pastel
-    )
-    st.plotly_chart(compare_fig, use_container_width=True)
+        calls = tuple((f"aggregation/{endpoint}", (("group_by", "country"), ("metric", "count"))) for endpoint in metrics.values())
+        sector_data = fetch_json_many(calls, (None,) * len(calls))
+    except httpx.HTTPError:
+        sector_data = [None] * len(metrics)
+
+    # Build the long (Country, Sector, Total) frame directly rather than pivoting wide then melting
+    frames = []
+    for label, data in zip(metrics, sector_data):
+        if data is None:
+            continue
+        try:
+            df = to_df(data)
+            frames.append(pd.DataFrame({
+                "Country": df["country"],
+                "Sector": label,
+                # Null totals (e.g. SUM over an empty group) plot as zero
+                "Total (USD)": pd.to_numeric(df["total"], errors="coerce").fillna(0).astype("float64") * 1_000_000
+            }))
+        except KeyError:
+            continue
+
+    if frames:
+        melted_df = pd.concat(frames, ignore_index=True)
+        compare_fig = make_figure(
+            "bar",
+            melted_df,
+            x="Country",
+            y="Total (USD)",
+            color="Sector",
+            title="Total Digital Economy Metrics by Country and Sector",
+            barmode="group",
+            text_auto='.2s',
+            palette="Pastel"
+        )
+        st.plotly_chart(compare_fig, use_container_width=True)
+
+# Tabs
+if selected == "Halal E-commerce":
+    halal_ecommerce_tab()
+elif selected == "ICT & Fintech":
+    ict_fintech_tab()
+elif selected == "AI Insights":
+    ai_insights_tab()
+elif selected == "Data Explorer":
+    data_explorer_tab(countries)
+
+# Summary metrics
+key_metrics()
+
+# Country profile tool
+country_profile_tool(countries)
+
+# Country comparison
+country_comparison()
 
 # Download section
 st.sidebar.markdown("---")
@@ -229,16 +473,19 @@ st.sidebar.markdown("## 📥 Download Reports")
 available_reports = ["halal_ecommerce", "ict_services", "internet_penetration", "islamic_fintech"]
 selected_report = st.sidebar.selectbox("Select report to download", available_reports)
 
-try:
-    download_response = requests.get(f"{BACKEND_URL}/download/{selected_report}")
-    if download_response.status_code == 200:
+# Only pull the CSV once the user asks for it, not on every rerun
+if st.sidebar.button("Prepare CSV"):
+    st.session_state["prepared_report"] = selected_report
+
+if st.session_state.get("prepared_report") == selected_report:
+    try:
         st.sidebar.download_button(
             label="Download CSV",
-            data=download_response.content,
+            data=fetch_download(selected_report),
             file_name=f"{selected_report}.csv",
             mime="text/csv"
         )
-    else:
+    except httpx.HTTPStatusError:
         st.sidebar.info("Report not available for download.")
-except Exception as e:
-    st.sidebar.error(f"Error downloading report: {e}")
\ No newline at end of file
+    except Exception as e:
+        st.sidebar.error(f"Error downloading report: {e}")
\ No newline at end of file